@@ -1,8 +1,36 @@
 # -*- encoding: utf-8 -*-
+import numbers
+
 import h2o
+from h2o.exceptions import H2OTypeError, H2OValueError
 from h2o.job import H2OJob
 from h2o.frame import H2OFrame
-from h2o.utils.typechecks import assert_is_type, is_type
+from h2o.utils.typechecks import assert_is_type, is_type, _get_type_name
+
+# (name, type, default) of the H2OAutoML parameters that end up in build_control["stopping_criteria"]
+_STOPPING_CRITERIA = (
+    ("max_runtime_secs", int, 3600),
+    ("max_models", int, None),
+    ("stopping_metric", str, "AUTO"),
+    ("stopping_tolerance", float, 0.001),
+    ("stopping_rounds", int, 3),
+    ("seed", int, None),
+)
+
+# build_control of an H2OAutoML object with all the parameters at their defaults
+_DEFAULT_BUILD_CONTROL = {
+    "stopping_criteria": {name: default for name, _, default in _STOPPING_CRITERIA if default is not None}
+}
+
+# Arguments of H2OAutoML.train(), as opposed to the constructor arguments (in the order of _build_input_spec())
+_TRAIN_ARGS = ("x", "y", "training_frame", "fold_column", "weights_column", "validation_frame", "leaderboard_frame")
+
+# Types of H2OTwoDimTable columns that hold numbers
+_NUMERIC_TABLE_TYPES = {"integer", "long", "float", "double"}
+
+# The connection on which the server was last verified to have the AutoML extension
+_automl_checked_connection = None
+
 
 class H2OAutoML(object):
     """
@@ -53,6 +81,11 @@ class H2OAutoML(object):
     >>> aml = H2OAutoML(max_runtime_secs = 30)
     >>> aml.train(x = x, y = y,training_frame = train,leaderboard_frame = test)
     """
+    # No per-instance __dict__: keeps AutoML handles small when many of them are kept around (e.g. in sweeps)
+    __slots__ = ("max_runtime_secs", "max_models", "stopping_metric", "stopping_tolerance", "stopping_rounds", "seed",
+                 "project_name", "build_control", "_job", "_automl_key", "_leader_id", "_leaderboard",
+                 "_leader_model", "_cached_res", "_leaderboard_etag", "_known_model_ids", "_model")
+
     def __init__(self,
                  max_runtime_secs=3600,
                  max_models=None,
@@ -62,65 +95,37 @@ class H2OAutoML(object):
                  seed=None,
                  project_name=None):
 
-        #Check if H2O jar contains AutoML
-        try:
-            h2o.api("GET /3/Metadata/schemas/AutoMLV99")
-        except h2o.exceptions.H2OResponseError as e:
-            print(e)
-            print("*******************************************************************\n" \
-                  "*Please verify that your H2O jar has the proper AutoML extensions.*\n" \
-                  "*******************************************************************\n" \
-                  "\nVerbose Error Message:")
-
-        #If max_runtime_secs is not provided, then it is set to default (600 secs)
-        if max_runtime_secs is not 3600:
-            assert_is_type(max_runtime_secs,int)
-            max_runtime_secs = max_runtime_secs
-            self.max_runtime_secs = max_runtime_secs
-        else:
-            self.max_runtime_secs = max_runtime_secs
-
-        #Make bare minimum build_control
+        #Check if H2O jar contains AutoML (once per connection)
+        global _automl_checked_connection
+        if _automl_checked_connection is None or _automl_checked_connection is not h2o.connection():
+            try:
+                h2o.api("GET /3/Metadata/schemas/AutoMLV99")
+                _automl_checked_connection = h2o.connection()
+            except h2o.exceptions.H2OResponseError as e:
+                print(e)
+                print("*******************************************************************\n" \
+                      "*Please verify that your H2O jar has the proper AutoML extensions.*\n" \
+                      "*******************************************************************\n" \
+                      "\nVerbose Error Message:")
+
+        #Make bare minimum build_control; parameters left at None are not sent, so that the back end uses its defaults
         self.build_control = {
-            'stopping_criteria': {
-                'max_runtime_secs': self.max_runtime_secs,
-            }
+            'stopping_criteria': {}
         }
-
-        #Add other parameters to build_control if available
-        if max_models is not None:
-            assert_is_type(max_models,int)
-            self.build_control["stopping_criteria"]["max_models"] = max_models
-            self.max_models = max_models
-
-        if stopping_metric is not "AUTO":
-            assert_is_type(stopping_metric,str)
-            self.build_control["stopping_criteria"]["stopping_metric"] = stopping_metric
-            self.stopping_metric = stopping_metric
-        else:
-            self.build_control["stopping_criteria"]["stopping_metric"] = stopping_metric
-            self.stopping_metric = stopping_metric
-
-        if stopping_tolerance is not 0.001:
-            assert_is_type(stopping_tolerance,float)
-            self.build_control["stopping_criteria"]["stopping_tolerance"] = stopping_tolerance
-            self.stopping_tolerence = stopping_tolerance
-        else:
-            self.build_control["stopping_criteria"]["stopping_tolerance"] = stopping_tolerance
-            self.stopping_tolerence = stopping_tolerance
-
-        if stopping_rounds is not 3:
-            assert_is_type(stopping_rounds,int)
-            self.build_control["stopping_criteria"]["stopping_rounds"] = stopping_rounds
-            self.stopping_rounds = stopping_rounds
-        else:
-            self.build_control["stopping_criteria"]["stopping_rounds"] = stopping_rounds
-            self.stopping_rounds = stopping_rounds
-
-        if seed is not None:
-            assert_is_type(seed,int)
-            self.build_control["stopping_criteria"]["seed"] = seed
-            self.seed = seed
+        stopping_criteria = self.build_control["stopping_criteria"]
+        values = (max_runtime_secs, max_models, stopping_metric, stopping_tolerance, stopping_rounds, seed)
+        for (name, ptype, default), value in zip(_STOPPING_CRITERIA, values):
+            # Only the parameters that default to None may be left unset
+            if value is None and default is None:
+                setattr(self, name, value)
+                continue
+            # Exact builtin types are accepted directly; anything else (subclasses, Py2 long/unicode) goes through
+            # the generic (and much slower) is_type()
+            if type(value) is not ptype and not is_type(value, ptype):
+                raise H2OTypeError(var_name=name, var_value=value, var_type_name=_get_type_name(type(value)),
+                                   exp_type_name=("?" if default is None else "") + _get_type_name(ptype))
+            stopping_criteria[name] = value
+            setattr(self, name, value)
 
         #Set project name if provided. If None, then we set in .train() to "automl_" + training_frame.frame_id
         if project_name is not None:
@@ -130,10 +135,46 @@ class H2OAutoML(object):
         else:
             self.project_name = None
 
+        self._init_state()
+
+    @classmethod
+    def default(cls, max_runtime_secs=3600):
+        """
+        Create an H2OAutoML object with all the parameters at their defaults, except for ``max_runtime_secs``.
+
+        This is a cheaper equivalent of ``H2OAutoML(max_runtime_secs=max_runtime_secs)``, meant for code that creates
+        many AutoML objects: the ``build_control`` is copied from a precomputed template instead of being validated
+        parameter by parameter, and the server is not probed for the AutoML extension.
+
+        :param int max_runtime_secs: How long the AutoML run will execute. Defaults to 3600 seconds (1 hour).
+
+        :returns: A new H2OAutoML object.
+
+        :examples:
+        >>> aml = H2OAutoML.default(max_runtime_secs=30)
+        >>> aml.train(y=y, training_frame=training_frame)
+        """
+        assert_is_type(max_runtime_secs, int)
+        self = cls.__new__(cls)
+        self.build_control = {
+            "stopping_criteria": dict(_DEFAULT_BUILD_CONTROL["stopping_criteria"], max_runtime_secs=max_runtime_secs)
+        }
+        for name, _, default in _STOPPING_CRITERIA:
+            setattr(self, name, default)
+        self.max_runtime_secs = max_runtime_secs
+        self.project_name = None
+        self._init_state()
+        return self
+
+    def _init_state(self):
         self._job = None
         self._automl_key = None
         self._leader_id = None
         self._leaderboard = None
+        self._leader_model = None
+        self._cached_res = None
+        self._leaderboard_etag = None
+        self._known_model_ids = None
 
     #---------------------------------------------------------------------------
     # Basic properties
@@ -153,7 +194,10 @@ class H2OAutoML(object):
         >>> # Get the top model
         >>> aml.leader
         """
-        return h2o.get_model(self._leader_id)
+        # The model is fetched once per leader; a new leader found by _fetch() invalidates it
+        if self._leader_model is None or self._leader_model.model_id != self._leader_id:
+            self._leader_model = h2o.get_model(self._leader_id)
+        return self._leader_model
 
     @property
     def leaderboard(self):
@@ -176,6 +220,89 @@ class H2OAutoML(object):
     #---------------------------------------------------------------------------
     # Training AutoML
     #---------------------------------------------------------------------------
+    def start(self, x = None, y = None, training_frame = None, fold_column = None,
+              weights_column = None, validation_frame = None, leaderboard_frame=None):
+        """
+        Begins an AutoML task asynchronously (to block for results call :meth:`join`).
+
+        The AutoML run executes in the backend while the client is free to do other work, for example to start
+        more AutoML projects on the same cluster. Accepts the same arguments as :meth:`train`.
+
+        :examples:
+        >>> # Start two AutoML projects side by side
+        >>> aml1 = H2OAutoML(max_runtime_secs=30, project_name="aml1")
+        >>> aml2 = H2OAutoML(max_runtime_secs=30, project_name="aml2")
+        >>> aml1.start(y=y, training_frame=training_frame)
+        >>> aml2.start(y=y, training_frame=training_frame)
+        >>> # Wait for both of them to finish
+        >>> aml1.join()
+        >>> aml2.join()
+        """
+        input_spec = _build_input_spec(x, y, training_frame, fold_column, weights_column, validation_frame,
+                                       leaderboard_frame)
+        self._train(input_spec, blocking=False)
+
+    def join(self):
+        """Wait until the AutoML task's completion, then fetch its leader and leaderboard."""
+        if self._job is None:
+            return
+        self._job.poll()
+        self._fetch()
+
+    @classmethod
+    def train_many(cls, configs, n_jobs=None, **shared_args):
+        """
+        Run several AutoML projects concurrently on the same H2O cluster.
+
+        All the projects are started asynchronously (as with :meth:`start`), so that the backend builds their models
+        side by side, and then joined in order. Every config is validated before the first project is started; if a
+        project fails to start or to finish, the projects that are still running are cancelled.
+
+        :param configs: A list of dicts, one per AutoML project. Each dict holds H2OAutoML constructor arguments
+            (e.g. ``seed``, ``max_models``, ``project_name``) and/or :meth:`train` arguments (e.g. ``x``,
+            ``training_frame``).
+        :param int n_jobs: The maximum number of AutoML projects running at the same time. Defaults to ``None``,
+            which means all of them are started at once.
+        :param shared_args: Constructor and :meth:`train` arguments common to all the projects. The entries of
+            each config take precedence over them.
+
+        :returns: A list of trained H2OAutoML objects, in the same order as ``configs``.
+
+        :examples:
+        >>> amls = H2OAutoML.train_many([dict(seed=1, project_name="seed1"), dict(seed=2, project_name="seed2")],
+        ...                             max_runtime_secs=30, y=y, training_frame=training_frame)
+        >>> [aml.leader.model_id for aml in amls]
+        """
+        assert_is_type(configs, [dict])
+        assert_is_type(n_jobs, None, int)
+        if n_jobs is not None and n_jobs < 1:
+            raise H2OValueError("n_jobs must be a positive integer, got %d" % n_jobs)
+
+        # Build every AutoML object and input_spec first, so that a bad config fails before any job is started
+        automls = []
+        input_specs = []
+        for config in configs:
+            params = dict(shared_args)
+            params.update(config)
+            train_params = [params.pop(arg, None) for arg in _TRAIN_ARGS]
+            input_specs.append(_build_input_spec(*train_params))
+            automls.append(cls(**params))
+
+        running = []
+        try:
+            for aml, input_spec in zip(automls, input_specs):
+                if n_jobs is not None and len(running) >= n_jobs:
+                    running.pop(0).join()
+                aml._train(input_spec, blocking=False)
+                running.append(aml)
+            while running:
+                running.pop(0).join()
+        except BaseException:
+            for aml in running:
+                aml._cancel()
+            raise
+        return automls
+
     def train(self, x = None, y = None, training_frame = None, fold_column = None, 
               weights_column = None, validation_frame = None, leaderboard_frame=None):
         """
@@ -202,72 +329,15 @@ class H2OAutoML(object):
         >>> # Launch H2OAutoML
         >>> aml.train(y=y, training_frame=training_frame)
         """
-        ncols = training_frame.ncols
-        names = training_frame.names
-
-        #Minimal required arguments are training_frame and y (response)
-        if y is None:
-            raise ValueError('The response column (y) is not set; please set it to the name of the column that you are trying to predict in your data.')
-        else:
-            assert_is_type(y,int,str)
-            if is_type(y, int):
-                if not (-ncols <= y < ncols):
-                    raise H2OValueError("Column %d does not exist in the training frame" % y)
-                y = names[y]
-            else:
-                if y not in names:
-                    raise H2OValueError("Column %s does not exist in the training frame" % y)
-            input_spec = {
-                'response_column': y,
-            }
-
-        if training_frame is None:
-            raise ValueError('The training frame is not set!')
-        else:
-            assert_is_type(training_frame, H2OFrame)
-            input_spec['training_frame'] = training_frame.frame_id
-
-        if fold_column is not None:
-            assert_is_type(fold_column,int,str)
-            input_spec['fold_column'] = fold_column
-
-        if weights_column is not None:
-            assert_is_type(weights_column,int,str)
-            input_spec['weights_column'] = weights_column
-
-        if validation_frame is not None:
-            assert_is_type(training_frame, H2OFrame)
-            input_spec['validation_frame'] = validation_frame.frame_id
-
-        if leaderboard_frame is not None:
-            assert_is_type(training_frame, H2OFrame)
-            input_spec['leaderboard_frame'] = leaderboard_frame.frame_id
-
-        if x is not None:
-            assert_is_type(x,list)
-            xset = set()
-            if is_type(x, int, str): x = [x]
-            for xi in x:
-                if is_type(xi, int):
-                    if not (-ncols <= xi < ncols):
-                        raise H2OValueError("Column %d does not exist in the training frame" % xi)
-                    xset.add(names[xi])
-                else:
-                    if xi not in names:
-                        raise H2OValueError("Column %s not in the training frame" % xi)
-                    xset.add(xi)
-            x = list(xset)
-            ignored_columns = set(names) - {y} - set(x)
-            if fold_column is not None: ignored_columns = ignored_columns.remove(fold_column)
-            if weights_column is not None: ignored_columns = ignored_columns.remove(weights_column)
-            if ignored_columns is not None:
-                input_spec['ignored_columns'] = list(ignored_columns)
-
-        automl_build_params = dict(input_spec = input_spec)
+        input_spec = _build_input_spec(x, y, training_frame, fold_column, weights_column, validation_frame,
+                                       leaderboard_frame)
+        self._train(input_spec, blocking=True)
 
+    def _train(self, input_spec, blocking):
         # NOTE: if the user hasn't specified some block of parameters don't send them!
         # This lets the back end use the defaults.
-        automl_build_params['build_control'] = self.build_control
+        # build_control was validated once in the constructor, so it is sent as is on every call
+        automl_build_params = dict(input_spec = input_spec, build_control = self.build_control)
 
         resp = h2o.api('POST /99/AutoMLBuilder', json=automl_build_params)
         if 'job' not in resp:
@@ -277,10 +347,10 @@ class H2OAutoML(object):
 
         self._job = H2OJob(resp['job'], "AutoML")
         self._automl_key = self._job.dest_key
-        self._job.poll()
-        self._fetch()
         if self.project_name is None:
-            self.project_name = "automl_" + training_frame.frame_id
+            self.project_name = "automl_" + input_spec['training_frame']
+        if blocking:
+            self.join()
 
     #---------------------------------------------------------------------------
     # Predict with AutoML
@@ -303,25 +373,162 @@ class H2OAutoML(object):
 
         """
         if self._fetch():
-            self._model = h2o.get_model(self._leader_id)
+            self._model = self.leader
             return self._model.predict(test_data)
         print("No model built yet...")
 
     #-------------------------------------------------------------------------------------------------------------------
     # Private
     #-------------------------------------------------------------------------------------------------------------------
+    def _cancel(self):
+        # Best effort: the caller is already handling another error
+        if self._job is None or self._job.status not in {"CREATED", "RUNNING"}:
+            return
+        try:
+            h2o.api("POST /3/Jobs/%s/cancel" % self._job.job_key)
+        except Exception:
+            pass
+
     def _fetch(self):
-        res = h2o.api("GET /99/AutoML/" + self._automl_key)
-        leaderboard_list = [key["name"] for key in res['leaderboard']['models']]
+        if self._has_final_state():
+            return self._leader_id is not None
 
-        if leaderboard_list is not None and len(leaderboard_list) > 0:
-            self._leader_id = leaderboard_list[0]
-        else:
-            self._leader_id = None
-        self._leaderboard = h2o.H2OFrame(res["leaderboard_table"].as_data_frame())[1:]
+        res = h2o.api("GET /99/AutoML/" + self._automl_key)
+        models = res['leaderboard']['models']
+        self._leader_id = models[0]["name"] if models else None
+
+        # Models never change once built, so the leaderboard frame only needs to be re-uploaded when models have
+        # been added (which may also reorder the existing ones)
+        model_ids = tuple(model["name"] for model in models)
+        if model_ids != self._known_model_ids:
+            self._leaderboard = self._make_leaderboard_frame(res["leaderboard_table"])
+            self._known_model_ids = model_ids
+        self._cached_res = res
+        self._leaderboard_etag = self._etag()
         return self._leader_id is not None
 
+    @staticmethod
+    def _make_leaderboard_frame(leaderboard_table):
+        # The first column of the table holds the (empty) row headers. The column types are passed explicitly,
+        # so that the frame is parsed in one shot without guessing them from the data.
+        rows = [row[1:] for row in leaderboard_table.cell_values]
+        if not rows:
+            return None
+        column_types = None
+        if leaderboard_table.col_types:
+            column_types = ["numeric" if t in _NUMERIC_TABLE_TYPES else "string"
+                            for t in leaderboard_table.col_types[1:]]
+        return h2o.H2OFrame(rows, header=-1, column_names=leaderboard_table.col_header[1:], column_types=column_types)
+
     def _get_params(self):
-        res = h2o.api("GET /99/AutoML/" + self._automl_key)
-        return res
+        if not self._has_final_state():
+            self._fetch()
+        return self._cached_res
+
+    def _etag(self):
+        return self._automl_key, self._job.status if self._job is not None else None
+
+    def _has_final_state(self):
+        # Once the job is done the AutoML state cannot change anymore, so the last response can be reused
+        etag = self._etag()
+        return self._cached_res is not None and etag == self._leaderboard_etag and etag[1] == "DONE"
+
 
+def _build_input_spec(x, y, training_frame, fold_column, weights_column, validation_frame, leaderboard_frame):
+    """
+    Validate the arguments of :meth:`H2OAutoML.train` and build the ``input_spec`` of the AutoMLBuilder request.
+
+    :returns: the ``input_spec`` dict.
+    :raises H2OValueError: if ``training_frame`` or ``y`` is not set, or if some of the columns do not exist in the
+        training frame.
+    """
+    #Minimal required arguments are training_frame and y (response)
+    if training_frame is None:
+        raise H2OValueError('The training frame is not set!')
+    assert_is_type(training_frame, H2OFrame)
+    # Read the column names once: the frame's properties may need a round-trip to the server
+    names = training_frame.names
+    names_set = set(names)
+
+    if y is None:
+        raise H2OValueError('The response column (y) is not set; please set it to the name of the column that you are trying to predict in your data.')
+    else:
+        assert_is_type(y,int,str)
+        y = _column_name(y, names, names_set)
+        input_spec = {
+            'response_column': y,
+            'training_frame': training_frame.frame_id,
+        }
+
+    if fold_column is not None:
+        assert_is_type(fold_column,int,str)
+        fold_column = _column_name(fold_column, names, names_set)
+        input_spec['fold_column'] = fold_column
+
+    if weights_column is not None:
+        assert_is_type(weights_column,int,str)
+        weights_column = _column_name(weights_column, names, names_set)
+        input_spec['weights_column'] = weights_column
+
+    if validation_frame is not None:
+        assert_is_type(validation_frame, H2OFrame)
+        input_spec['validation_frame'] = validation_frame.frame_id
+
+    if leaderboard_frame is not None:
+        assert_is_type(leaderboard_frame, H2OFrame)
+        input_spec['leaderboard_frame'] = leaderboard_frame.frame_id
+
+    if x is not None:
+        if is_type(x, int, str): x = [x]
+        assert_is_type(x, [int, str])
+        xset = _predictor_names(x, names, names_set)
+        # Everything that is neither a predictor nor a special column gets ignored, in the frame's column order
+        used_columns = xset | {y, fold_column, weights_column}
+        input_spec['ignored_columns'] = [name for name in names if name not in used_columns]
+
+    return input_spec
+
+
+def _column_name(column, names, names_set):
+    """
+    Resolve a column given by name or index into the name of a column of the training frame.
+
+    :param column: column name or column index.
+    :param names: list of the training frame's column names.
+    :param names_set: the same names, as a set.
+    :returns: the column name.
+    :raises H2OValueError: if the column does not exist in the training frame.
+    """
+    if is_type(column, int):
+        if not (-len(names) <= column < len(names)):
+            raise H2OValueError("Column %d does not exist in the training frame" % column)
+        return names[column]
+    if column not in names_set:
+        raise H2OValueError("Column %s does not exist in the training frame" % column)
+    return column
+
+
+def _predictor_names(x, names, names_set):
+    """
+    Resolve the predictor columns into a set of column names of the training frame.
+
+    :param x: list of column names and/or column indices.
+    :param names: list of the training frame's column names.
+    :param names_set: the same names, as a set.
+    :returns: the set of predictor column names.
+    :raises H2OValueError: if some of the columns do not exist in the training frame.
+    """
+    # The elements of x have already been checked to be names or indices, and an index never equals a name,
+    # so a set lookup alone tells them apart for the (common) valid names
+    ncols = len(names)
+    xset = set()
+    for xi in x:
+        if xi in names_set:
+            xset.add(xi)
+        elif not isinstance(xi, numbers.Integral):
+            raise H2OValueError("Column %s not in the training frame" % xi)
+        elif -ncols <= xi < ncols:
+            xset.add(names[xi])
+        else:
+            raise H2OValueError("Column %d does not exist in the training frame" % xi)
+    return xset
@@ -23,7 +23,9 @@ import time
 from warnings import warn
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
+from requests.compat import cookielib
 
 from h2o.backend import H2OCluster, H2OLocalServer
 from h2o.exceptions import H2OConnectionError, H2OServerError, H2OResponseError, H2OValueError
@@ -395,9 +397,10 @@ class H2OConnection(backwards_compatible()):
             headers = {"User-Agent": "H2O Python client/" + sys.version.replace("\n", ""),
                        "X-Cluster": self._cluster_id,
                        "Cookie": self._cookies}
-            resp = requests.request(method=method, url=url, data=data, json=json, files=files, params=params,
-                                    headers=headers, timeout=self._timeout, stream=stream,
-                                    auth=self._auth, verify=self._verify_ssl_cert, proxies=self._proxies)
+            session = self._get_http_session()
+            resp = session.request(method=method, url=url, data=data, json=json, files=files, params=params,
+                                   headers=headers, timeout=self._timeout, stream=stream,
+                                   auth=self._auth, verify=self._verify_ssl_cert, proxies=self._proxies)
             self._log_end_transaction(start_time, resp)
             return self._process_response(resp, save_to)
 
@@ -436,6 +439,9 @@ class H2OConnection(backwards_compatible()):
             except Exception:
                 pass
             self._session_id = None
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
         self._stage = -1
 
 
@@ -535,9 +541,28 @@ class H2OConnection(backwards_compatible()):
         self._is_logging = False    # when True, log every request
         self._logging_dest = None   # where the log messages will be written, either filename or open file handle
         self._local_server = None   # H2OLocalServer instance to which we are connected (if known)
+        self._http_session = None   # requests.Session keeping the HTTP connections to the server alive
         # self.start_logging(sys.stdout)
 
 
+    def _get_http_session(self):
+        """
+        Return the ``requests.Session`` used for all the API requests, creating it on first use.
+
+        Reusing one session lets consecutive requests (e.g. job polling) share keep-alive connections instead of
+        opening a new TCP (and possibly TLS) connection each time.
+        """
+        if self._http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            # Cookies are sent explicitly with every request, so don't collect them from the responses
+            session.cookies.set_policy(cookielib.DefaultCookiePolicy(allowed_domains=[]))
+            self._http_session = session
+        return self._http_session
+
+
     def _test_connection(self, max_retries=5, messages=None):
         """
         Test that the H2O cluster can be reached, and retrieve basic cloud status info.
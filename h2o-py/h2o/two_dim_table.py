@@ -38,6 +38,7 @@ class H2OTwoDimTable(object):
         self._table_header = table_header
         self._table_description = table_description
         self._col_header = col_header
+        self._col_types = col_types
         self._cell_values = cell_values or self._parse_values(raw_cell_values, col_types)
 
 
@@ -74,6 +75,12 @@ class H2OTwoDimTable(object):
         return self._col_header
 
 
+    @property
+    def col_types(self):
+        """Array of column types (as reported by the server), or None if not known."""
+        return self._col_types
+
+
     def as_data_frame(self):
         """Convert to a python 'data frame'."""
         if can_use_pandas():
@@ -120,6 +127,7 @@ class H2OTwoDimTable(object):
             self._col_header = self._col_header[1:]
             types = types[1:]
             values = values[1:]
+            self._col_types = types
         for col_index, column in enumerate(values):
             for row_index, row_value in enumerate(column):
                 if types[col_index] == 'integer':
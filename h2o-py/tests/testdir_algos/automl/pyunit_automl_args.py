@@ -30,11 +30,18 @@ def prostate_automl():
     assert aml.max_runtime_secs == 10, "max_runtime_secs is not set to 10 secs"
     assert aml.project_name == "aml", "Project name is not set"
     assert aml.stopping_rounds == 3, "stopping_rounds is not set to 3"
-    assert aml.stopping_tolerence == 0.001, "stopping_tolerance is not set to 0.001"
+    assert aml.stopping_tolerance == 0.001, "stopping_tolerance is not set to 0.001"
     assert aml.stopping_metric == "AUC", "stopping_metrics is not set to `AUC`"
     assert aml.max_models == 10, "max_models is not set to 10"
     assert aml.seed == 1234, "seed is not set to `1234`"
 
+    print("Check that H2OAutoML.default() matches H2OAutoML with default arguments")
+    aml_default = H2OAutoML.default(max_runtime_secs = 10)
+    assert aml_default.build_control == H2OAutoML(max_runtime_secs = 10).build_control, "build_control differs"
+    assert aml_default.max_runtime_secs == 10, "max_runtime_secs is not set to 10 secs"
+    assert aml_default.stopping_rounds == 3, "stopping_rounds is not set to 3"
+    assert aml_default.max_models is None, "max_models is not set to None"
+
     print("AutoML run with x not provided and train set only")
     aml.project_name = "Project1"
     aml.train(y="CAPSULE", training_frame=train)
@@ -42,7 +49,7 @@ def prostate_automl():
     assert aml.project_name == "Project1", "Project name is not set"
     assert aml.project_name == "Project1", "Project name is not set"
     assert aml.stopping_rounds == 3, "stopping_rounds is not set to 3"
-    assert aml.stopping_tolerence == 0.001, "stopping_tolerance is not set to 0.001"
+    assert aml.stopping_tolerance == 0.001, "stopping_tolerance is not set to 0.001"
     assert aml.stopping_metric == "AUC", "stopping_metrics is not set to `AUC`"
     assert aml.max_models == 10, "max_models is not set to 10"
     assert aml.seed == 1234, "seed is not set to `1234`"
@@ -53,7 +60,7 @@ def prostate_automl():
     assert aml.max_runtime_secs == 10, "max_runtime_secs is not set to 10 secs"
     assert aml.project_name == "Project2", "Project name is not set"
     assert aml.stopping_rounds == 3, "stopping_rounds is not set to 3"
-    assert aml.stopping_tolerence == 0.001, "stopping_tolerance is not set to 0.001"
+    assert aml.stopping_tolerance == 0.001, "stopping_tolerance is not set to 0.001"
     assert aml.stopping_metric == "AUC", "stopping_metrics is not set to `AUC`"
     assert aml.max_models == 10, "max_models is not set to 10"
     assert aml.seed == 1234, "seed is not set to `1234`"
@@ -64,7 +71,7 @@ def prostate_automl():
     assert aml.max_runtime_secs == 10, "max_runtime_secs is not set to 10 secs"
     assert aml.project_name == "Project3", "Project name is not set"
     assert aml.stopping_rounds == 3, "stopping_rounds is not set to 3"
-    assert aml.stopping_tolerence == 0.001, "stopping_tolerance is not set to 0.001"
+    assert aml.stopping_tolerance == 0.001, "stopping_tolerance is not set to 0.001"
     assert aml.stopping_metric == "AUC", "stopping_metrics is not set to `AUC`"
     assert aml.max_models == 10, "max_models is not set to 10"
     assert aml.seed == 1234, "seed is not set to `1234`"
@@ -75,7 +82,7 @@ def prostate_automl():
     assert aml.max_runtime_secs == 10, "max_runtime_secs is not set to 10 secs"
     assert aml.project_name == "Project4", "Project name is not set"
     assert aml.stopping_rounds == 3, "stopping_rounds is not set to 3"
-    assert aml.stopping_tolerence == 0.001, "stopping_tolerance is not set to 0.001"
+    assert aml.stopping_tolerance == 0.001, "stopping_tolerance is not set to 0.001"
     assert aml.stopping_metric == "AUC", "stopping_metrics is not set to `AUC`"
     assert aml.max_models == 10, "max_models is not set to 10"
     assert aml.seed == 1234, "seed is not set to `1234`"
@@ -86,7 +93,7 @@ def prostate_automl():
     assert aml.max_runtime_secs == 10, "max_runtime_secs is not set to 10 secs"
     assert aml.project_name == "Project5", "Project name is not set"
     assert aml.stopping_rounds == 3, "stopping_rounds is not set to 3"
-    assert aml.stopping_tolerence == 0.001, "stopping_tolerance is not set to 0.001"
+    assert aml.stopping_tolerance == 0.001, "stopping_tolerance is not set to 0.001"
     assert aml.stopping_metric == "AUC", "stopping_metrics is not set to `AUC`"
     assert aml.max_models == 10, "max_models is not set to 10"
     assert aml.seed == 1234, "seed is not set to `1234`"
@@ -50,6 +50,34 @@ def prostate_automl():
     models = aml.leaderboard["model_id"]
     pyunit_utils.check_ignore_cols_automl(models,names,x,y)
 
+    print("AutoML with x and fold/weights columns, given as names and as indices")
+    train["fold"] = train["ID"] % 3
+    names = train.names
+    fold_index = names.index("fold")
+    weights_index = names.index("VOL")
+    x = ["AGE","RACE","DPROS"]
+    for i, (x_arg, fold_column, weights_column) in enumerate([(x, "fold", None),
+                                                             (x, None, "VOL"),
+                                                             (x, "fold", "VOL"),
+                                                             ([2,3,4], fold_index, weights_index)]):
+        aml = H2OAutoML(project_name="ignore_cols_special_%d" % i, max_models=2, max_runtime_secs=30, seed=1)
+        aml.train(x=x_arg, y=y, training_frame=train, fold_column=fold_column, weights_column=weights_column)
+        special_columns = {names[c] if isinstance(c, int) else c
+                           for c in (fold_column, weights_column) if c is not None}
+        check_ignore_cols_special(aml.leaderboard["model_id"], names, x, y, special_columns)
+
+
+def check_ignore_cols_special(models, names, x, y, special_columns):
+    expected = set(names) - {y} - set(x) - special_columns
+    models = sum(models.as_data_frame().values.tolist(),[])
+    for model in models:
+        if "StackedEnsemble" in model:
+            continue
+        ignored = h2o.get_model(model).params["ignored_columns"]["actual"] or []
+        assert set(ignored) == expected, "ignored columns are not honored for model " + model
+        assert not special_columns & set(ignored), "fold/weights columns are ignored for model " + model
+
+
 if __name__ == "__main__":
     pyunit_utils.standalone_test(prostate_automl)
 else:
@@ -0,0 +1,38 @@
+from __future__ import print_function
+import sys, os
+sys.path.insert(1, os.path.join("..","..",".."))
+import h2o
+from tests import pyunit_utils
+from h2o.automl import H2OAutoML
+
+"""
+This test is used to check the asynchronous `.start()` / `.join()` API of H2OAutoML
+"""
+def prostate_automl_start_join():
+
+    df = h2o.import_file(path=pyunit_utils.locate("smalldata/logreg/prostate.csv"))
+    df["CAPSULE"] = df["CAPSULE"].asfactor()
+
+    print("Start an AutoML run and join it")
+    aml = H2OAutoML(project_name="start_join", max_models=2, max_runtime_secs=30, seed=1)
+    aml.start(y="CAPSULE", training_frame=df)
+    assert aml.project_name == "start_join", "Project name is not set"
+    aml.join()
+    assert aml.leader is not None, "No leader after join()"
+    assert aml.leaderboard.nrows > 0, "Empty leaderboard after join()"
+    print(aml.leaderboard)
+
+    print("A failed start() must not leave the object in asynchronous mode")
+    aml = H2OAutoML(project_name="start_join_failed", max_models=2, max_runtime_secs=30, seed=1)
+    try:
+        aml.start(y="NO_SUCH_COLUMN", training_frame=df)
+        assert False, "start() should have failed on an unknown response column"
+    except ValueError:
+        pass
+    aml.train(y="CAPSULE", training_frame=df)
+    assert aml.leader is not None, "train() after a failed start() did not wait for the results"
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(prostate_automl_start_join)
+else:
+    prostate_automl_start_join()
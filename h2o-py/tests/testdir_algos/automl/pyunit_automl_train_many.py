@@ -0,0 +1,32 @@
+from __future__ import print_function
+import sys, os
+sys.path.insert(1, os.path.join("..","..",".."))
+import h2o
+from tests import pyunit_utils
+from h2o.automl import H2OAutoML
+
+"""
+This test is used to check that several AutoML projects can be run side by side with `H2OAutoML.train_many()`
+"""
+def prostate_automl_train_many():
+
+    df = h2o.import_file(path=pyunit_utils.locate("smalldata/logreg/prostate.csv"))
+    df["CAPSULE"] = df["CAPSULE"].asfactor()
+
+    configs = [dict(project_name="many_seed1", seed=1),
+               dict(project_name="many_seed2", seed=2),
+               dict(project_name="many_seed3", seed=3, x=["AGE","RACE","DPROS"])]
+    amls = H2OAutoML.train_many(configs, n_jobs=2, max_models=2, max_runtime_secs=30, y="CAPSULE", training_frame=df)
+
+    assert len(amls) == 3, "Expected one H2OAutoML object per config"
+    for aml, config in zip(amls, configs):
+        assert aml.project_name == config["project_name"], "Project name is not set"
+        assert aml.seed == config["seed"], "seed is not set"
+        assert aml.max_models == 2, "max_models is not set to 2"
+        assert aml.leader is not None, "No leader for project %s" % aml.project_name
+        print(aml.leaderboard)
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(prostate_automl_train_many)
+else:
+    prostate_automl_train_many()